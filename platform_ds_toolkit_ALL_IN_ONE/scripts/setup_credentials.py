@@ -1,9 +1,10 @@
-from platform_ds_toolkit.credentials.key_manager import generate_key
+from platform_ds_toolkit.credentials.key_manager import DEFAULT_KEY_PATH, generate_key
 from platform_ds_toolkit.credentials.vault import CredentialVault
 
 def main():
-  try: generate_key()
-  except: pass
+  if not DEFAULT_KEY_PATH.exists():
+    try: generate_key()
+    except FileExistsError: pass  # created concurrently by another process
   v=CredentialVault(); v.save_credentials('example/db',{'user':'u','password':'p'})
 
 if __name__=='__main__': main()
@@ -1,13 +1,17 @@
 
+from typing import Optional
+
 import pandas as pd
 import numpy as np
+from scipy.special import expit
 from sklearn.linear_model import LogisticRegression
 from sklearn.preprocessing import StandardScaler
 from sklearn.pipeline import Pipeline
 from sklearn.metrics import precision_recall_fscore_support
 
 class SpecialsClassifier:
-    def __init__(self, C: float = 1.0):
+    def __init__(self, C: float = 1.0, cache_dir: Optional[str] = None):
+        # cache_dir memoizes the fitted scaler across repeated fits (CV / grid search)
         self.pipeline = Pipeline(
             steps=[
                 ("scaler", StandardScaler()),
@@ -15,26 +19,41 @@ class SpecialsClassifier:
                     "clf",
                     LogisticRegression(
                         C=C,
-                        solver="lbfgs",
-                        max_iter=1000,
+                        solver="saga",
+                        max_iter=200,
+                        tol=1e-3,
                         class_weight="balanced",
                     ),
                 ),
-            ]
+            ],
+            memory=cache_dir,
         )
+        self._feature_columns: Optional[list] = None
+
+    def _prepare(self, X: pd.DataFrame) -> np.ndarray:
+        # One contiguous float32 copy up front, in fit-time column order, so
+        # scikit-learn's check_array has nothing left to convert
+        if self._feature_columns is not None:
+            X = X[self._feature_columns]
+        return np.ascontiguousarray(X.to_numpy(dtype=np.float32, copy=False))
 
     def fit(self, X: pd.DataFrame, y: pd.Series):
-        self.pipeline.fit(X, y)
+        self._feature_columns = list(X.columns)
+        self.pipeline.fit(self._prepare(X), y)
         return self
 
     def predict(self, X: pd.DataFrame) -> np.ndarray:
-        return self.pipeline.predict(X)
+        return self.pipeline.predict(self._prepare(X))
 
     def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
-        return self.pipeline.predict_proba(X)[:, 1]
+        # P(special) straight from the logit; avoids building the 2-column proba array
+        return expit(self.pipeline.decision_function(self._prepare(X)))
 
     def evaluate(self, X: pd.DataFrame, y: pd.Series) -> dict:
-        preds = self.predict(X)
+        # threshold the logit and map through classes_, exactly as LogisticRegression.predict
+        # does; a float32 probability would round tiny positive logits to exactly 0.5
+        scores = self.pipeline.decision_function(self._prepare(X))
+        preds = self.pipeline.classes_[(scores > 0).astype(int)]
         precision, recall, f1, _ = precision_recall_fscore_support(
             y, preds, average="binary"
         )
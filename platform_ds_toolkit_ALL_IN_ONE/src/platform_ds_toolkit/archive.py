@@ -1,4 +1,12 @@
 from pathlib import Path
 import shutil, json, hashlib, datetime
 
-def archive_file(src, root): root=Path(root); root.mkdir(exist_ok=True); d=root/datetime.datetime.now().strftime('%Y%m%d_%H%M%S'); d.mkdir(); f=Path(src); c=d/f.name; shutil.copy2(f,c); h=hashlib.sha256(c.read_bytes()).hexdigest(); (d/'manifest.json').write_text(json.dumps({'file':f.name,'sha256':h},indent=2)); return d
+def _copy_sha256(src, dst):
+  # single pass: each chunk is written and hashed while it is still in memory
+  h=hashlib.sha256()
+  with open(src,'rb') as fi, open(dst,'wb') as fo:
+    for b in iter(lambda: fi.read(1<<20), b''): fo.write(b); h.update(b)
+  shutil.copystat(src,dst)
+  return h.hexdigest()
+
+def archive_file(src, root): root=Path(root); root.mkdir(exist_ok=True); d=root/datetime.datetime.now().strftime('%Y%m%d_%H%M%S'); d.mkdir(); f=Path(src); c=d/f.name; h=_copy_sha256(f,c); (d/'manifest.json').write_text(json.dumps({'file':f.name,'sha256':h},indent=2)); return d
@@ -2,12 +2,15 @@
 credentials_store.py
 
 A small, dependency-free credential store that persists records to a JSON file.
+Uses orjson for (de)serialization when it is installed, stdlib json otherwise.
 
 Design goals:
 - Store arbitrary custom fields per credential (username, password, token, notes, etc.)
 - Ensure backing file + parent directory exist
-- Safe(ish) writes via atomic replace (write temp -> fsync -> replace)
+- Safe(ish) writes via atomic replace (write temp -> replace), with opt-in fsync for durability
 - Simple CRUD: upsert, get, list, delete
+- Batched writes: bulk_update() / batch() coalesce many mutations into one file write
+- Parsed store is cached in memory and only re-read when the file's mtime/size/inode change
 - Optional environment-variable expansion in file path (e.g., %USERPROFILE% on Windows)
 
 Security note:
@@ -20,9 +23,15 @@ import json
 import os
 import time
 import tempfile
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 
 class CredentialStoreError(Exception):
@@ -46,9 +55,16 @@ class StoreConfig:
     """
     file_path: Path to JSON file.
     auto_create: If True, creates file + parent directory if missing.
+    fsync: If True, flush the temp file to disk before the atomic replace (slower, survives power loss).
+    fdatasync: When fsync is enabled, prefer os.fdatasync where the platform provides it.
+    resolve_path: If True, resolve symlinks in file_path (one lstat per path component).
+        Otherwise the path is only made absolute, which touches no files.
     """
     file_path: Path
     auto_create: bool = True
+    fsync: bool = False
+    fdatasync: bool = True
+    resolve_path: bool = False
 
 
 def default_store_path(app_name: str = "platform_ds_toolkit") -> Path:
@@ -61,27 +77,72 @@ def default_store_path(app_name: str = "platform_ds_toolkit") -> Path:
     return home / f".{app_name}" / "credentials.json"
 
 
-def _expand_path(p: str | Path) -> Path:
+def _expand_path(p: str | Path, resolve: bool = False) -> Path:
     # Expand ~ and environment variables
     s = str(p)
     s = os.path.expandvars(s)
-    return Path(s).expanduser().resolve()
+    path = Path(s).expanduser()
+    if resolve:
+        return path.resolve()
+    # abspath is string-only (plus one getcwd); pins relative paths without walking the tree
+    return Path(os.path.abspath(path))
 
 
 def _now_ts() -> float:
     return time.time()
 
 
+def _file_stamp(path: Path) -> Tuple[int, int, int]:
+    # mtime alone misses same-tick rewrites on coarse-timestamp filesystems;
+    # os.replace always yields a new inode, and most rewrites change the size
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _dumps(data: Any) -> bytes:
+    # Both backends: 2-space indent, sorted keys, raw UTF-8, non-str keys coerced to str.
+    # Only float spelling can differ (orjson 1e-7 vs json 1e-07); values parse identically.
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Directories this process has already created (or found); saves a mkdir syscall per write
+_MKDIR_CACHE: Set[str] = set()
+
+
+def _ensure_dir(path: Path, force: bool = False) -> None:
+    """
+    mkdir -p that skips directories already seen. force=True re-creates one that was
+    removed after it was cached.
+    """
+    key = str(path)
+    if force or key not in _MKDIR_CACHE:
+        path.mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(key)
+
+
 def _ensure_file_exists(path: Path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(path.parent)
     if not path.exists():
-        path.write_text(json.dumps({"_meta": {"created_at": _now_ts()}, "credentials": {}}, indent=2))
+        payload = _dumps({"_meta": {"created_at": _now_ts()}, "credentials": {}})
+        try:
+            path.write_bytes(payload)
+        except FileNotFoundError:
+            _ensure_dir(path.parent, force=True)
+            path.write_bytes(payload)
 
 
 def _load_json(path: Path) -> Dict[str, Any]:
     try:
-        raw = path.read_text(encoding="utf-8")
-        data = json.loads(raw) if raw.strip() else {}
+        raw = path.read_bytes()
+        data = _loads(raw) if raw.strip() else {}
     except json.JSONDecodeError as e:
         raise CorruptStoreError(f"Credential store JSON is corrupt: {path}") from e
 
@@ -98,19 +159,30 @@ def _load_json(path: Path) -> Dict[str, Any]:
     return data
 
 
-def _atomic_write_json(path: Path, data: Dict[str, Any]) -> None:
+def _atomic_write_json(path: Path, data: Dict[str, Any], fsync: bool = False, fdatasync: bool = True) -> None:
     """
-    Atomic-ish write: write to temp file in same directory, fsync, then replace.
+    Atomic-ish write: write to temp file in same directory, optionally fsync, then replace.
+
+    The replace alone keeps readers from ever seeing a half-written file; fsync is only
+    needed if the new contents must survive a crash or power loss.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    payload = json.dumps(data, indent=2, sort_keys=True)
+    _ensure_dir(path.parent)
+    payload = _dumps(data)
 
-    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
+        fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
+    except FileNotFoundError:
+        _ensure_dir(path.parent, force=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
             f.write(payload)
-            f.flush()
-            os.fsync(f.fileno())
+            if fsync:
+                f.flush()
+                if fdatasync and hasattr(os, "fdatasync"):
+                    os.fdatasync(f.fileno())
+                else:
+                    os.fsync(f.fileno())
         os.replace(tmp_name, path)  # atomic on most OS/filesystems
     finally:
         # If replace failed, try cleanup
@@ -121,6 +193,59 @@ def _atomic_write_json(path: Path, data: Dict[str, Any]) -> None:
             pass
 
 
+def _json_key(k: Any) -> str:
+    # Same coercion json.dumps applies to dict keys (1 -> "1", True -> "true", None -> "null")
+    if k is None or isinstance(k, (bool, int, float)):
+        return json.dumps(k)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(k).__name__}")
+
+
+def _copy_json(obj: Any) -> Any:
+    """
+    Structural copy of a JSON-shaped value: containers are rebuilt, primitive leaves shared.
+    Cheaper than copy.deepcopy (no memo, no reduce protocol) and, like a JSON round-trip,
+    turns tuples into lists and non-str dict keys into their JSON strings.
+    """
+    if isinstance(obj, dict):
+        return {k if isinstance(k, str) else _json_key(k): _copy_json(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_copy_json(v) for v in obj]
+    return obj
+
+
+def _put_record(creds: Dict[str, Any], key: str, fields: Dict[str, Any], overwrite: bool, now: float) -> None:
+    if not isinstance(fields, dict):
+        raise ValueError("fields must be a dict")
+    if key in creds and not overwrite:
+        raise CredentialExistsError(f"Credential '{key}' already exists (overwrite=False).")
+
+    existing = creds.get(key, {})
+    created_at = existing.get("created_at", now)
+
+    # Ensure JSON-serializable (fail fast). Keys are normalized to str up front so the
+    # cached record matches what a reload returns, whichever JSON backend is in use.
+    try:
+        record = {
+            "created_at": created_at,
+            "updated_at": now,
+            "fields": _copy_json(fields),
+        }
+        _dumps(record)
+    except TypeError as e:
+        raise ValueError("fields contains non-JSON-serializable values") from e
+
+    creds[key] = record
+
+
+def _pop_record(creds: Dict[str, Any], key: str, missing_ok: bool) -> bool:
+    if key not in creds:
+        if missing_ok:
+            return False
+        raise CredentialNotFoundError(f"Credential '{key}' not found.")
+    del creds[key]
+    return True
+
+
 class CredentialStore:
     """
     JSON-backed store of credential "records".
@@ -132,8 +257,14 @@ class CredentialStore:
     """
 
     def __init__(self, config: StoreConfig):
-        self.path = _expand_path(config.file_path)
+        self.path = _expand_path(config.file_path, resolve=config.resolve_path)
         self.auto_create = config.auto_create
+        self.fsync = config.fsync
+        self.fdatasync = config.fdatasync
+        self._cache: Optional[Dict[str, Any]] = None
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._batch_depth = 0
+        self._batch_dirty = False
         if self.auto_create:
             _ensure_file_exists(self.path)
         elif not self.path.exists():
@@ -150,15 +281,73 @@ class CredentialStore:
         _ensure_file_exists(self.path)
 
     def _read_store(self) -> Dict[str, Any]:
-        if not self.path.exists():
-            if self.auto_create:
-                _ensure_file_exists(self.path)
-            else:
-                raise FileNotFoundError(f"Credential store file does not exist: {self.path}")
-        return _load_json(self.path)
+        """
+        Return the parsed store, reusing the in-memory copy while the file is unchanged.
+        The returned dict is the cache itself; mutate it only when followed by _write_store.
+        """
+        if self._batch_depth and self._cache is not None:
+            # Inside batch(): the cache holds pending writes, never reload over it
+            return self._cache
+
+        try:
+            stamp = _file_stamp(self.path)
+        except FileNotFoundError:
+            if not self.auto_create:
+                raise FileNotFoundError(f"Credential store file does not exist: {self.path}") from None
+            _ensure_file_exists(self.path)
+            stamp = _file_stamp(self.path)
+
+        if self._cache is None or stamp != self._stamp:
+            self._cache = _load_json(self.path)
+            self._stamp = stamp
+        return self._cache
 
     def _write_store(self, store: Dict[str, Any]) -> None:
-        _atomic_write_json(self.path, store)
+        if self._batch_depth:
+            self._cache = store
+            self._batch_dirty = True
+            return
+        try:
+            _atomic_write_json(self.path, store, fsync=self.fsync, fdatasync=self.fdatasync)
+        except BaseException:
+            # The cache may hold mutations that never reached disk
+            self._invalidate_cache()
+            raise
+        self._cache = store
+        self._stamp = _file_stamp(self.path)
+
+    def _invalidate_cache(self) -> None:
+        self._cache = None
+        self._stamp = None
+
+    @contextmanager
+    def batch(self) -> Iterator["CredentialStore"]:
+        """
+        Defer writes until the block exits, then write the store once.
+        If the block raises, pending changes are discarded and the file is left untouched.
+        A nested batch that raises rolls back only its own changes.
+
+            with store.batch():
+                store.upsert("a", {...})
+                store.delete("b")
+        """
+        # Nested: snapshot the pending state so a failure here can't leak into the outer batch
+        snapshot = (_copy_json(self._read_store()), self._batch_dirty) if self._batch_depth else None
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if snapshot is None:
+                self._batch_dirty = False
+                self._invalidate_cache()
+            else:
+                self._cache, self._batch_dirty = snapshot
+            raise
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0 and self._batch_dirty:
+            self._batch_dirty = False
+            self._write_store(self._read_store())
 
     def list_keys(self) -> List[str]:
         store = self._read_store()
@@ -173,8 +362,8 @@ class CredentialStore:
         rec = store["credentials"].get(key)
         if rec is None:
             return default
-        # Return a copy so callers don't mutate internal data accidentally
-        return json.loads(json.dumps(rec))
+        # Return a copy so callers don't mutate the cached store accidentally
+        return _copy_json(rec)
 
     def require(self, key: str) -> Dict[str, Any]:
         rec = self.get(key)
@@ -189,47 +378,42 @@ class CredentialStore:
         - if overwrite=False and key exists -> CredentialExistsError
         Returns the stored record.
         """
-        if not isinstance(fields, dict):
-            raise ValueError("fields must be a dict")
-
         store = self._read_store()
-        creds = store["credentials"]
-
         now = _now_ts()
-        if key in creds and not overwrite:
-            raise CredentialExistsError(f"Credential '{key}' already exists (overwrite=False).")
-
-        existing = creds.get(key, {})
-        created_at = existing.get("created_at", now)
-
-        record = {
-            "created_at": created_at,
-            "updated_at": now,
-            "fields": fields,
-        }
-
-        # Ensure JSON-serializable (fail fast)
-        try:
-            json.dumps(record)
-        except TypeError as e:
-            raise ValueError("fields contains non-JSON-serializable values") from e
-
-        creds[key] = record
+        _put_record(store["credentials"], key, fields, overwrite, now)
         store["_meta"]["updated_at"] = now
         self._write_store(store)
         return self.get(key)  # return a clean copy
 
     def delete(self, key: str, missing_ok: bool = False) -> None:
         store = self._read_store()
-        creds = store["credentials"]
-        if key not in creds:
-            if missing_ok:
-                return
-            raise CredentialNotFoundError(f"Credential '{key}' not found.")
-        del creds[key]
+        if not _pop_record(store["credentials"], key, missing_ok):
+            return
         store["_meta"]["updated_at"] = _now_ts()
         self._write_store(store)
 
+    def bulk_update(self, ops: Sequence[Tuple[str, str, Optional[Dict[str, Any]]]]) -> None:
+        """
+        Apply many mutations with a single file write.
+        - ops: sequence of ("upsert", key, fields) or ("delete", key, None)
+        - upserts always overwrite; deleting a missing key -> CredentialNotFoundError
+        All-or-nothing: if any op fails, nothing is written or left pending (also inside batch()).
+        """
+        store = self._read_store()
+        # Records are replaced, never mutated in place, so a shallow copy isolates the ops
+        creds = dict(store["credentials"])
+        now = _now_ts()
+        for op, key, fields in ops:
+            if op == "upsert":
+                _put_record(creds, key, fields, True, now)
+            elif op == "delete":
+                _pop_record(creds, key, False)
+            else:
+                raise ValueError(f"Unknown bulk_update op '{op}' (expected 'upsert' or 'delete')")
+        store["credentials"] = creds
+        store["_meta"]["updated_at"] = now
+        self._write_store(store)
+
     def update_fields(self, key: str, patch: Dict[str, Any]) -> Dict[str, Any]:
         """
         Merge patch dict into existing fields (shallow merge).
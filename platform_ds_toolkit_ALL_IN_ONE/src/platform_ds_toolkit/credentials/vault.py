@@ -1,10 +1,11 @@
 
-import json, logging, os
+import functools, logging, os
+import orjson
 from pathlib import Path
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from cryptography.fernet import Fernet
-from .key_manager import load_key
+from .key_manager import DEFAULT_KEY_PATH, load_key
 
 logger = logging.getLogger(__name__)
 
@@ -15,28 +16,44 @@ def _default_root() -> Path:
 
 DEFAULT_VAULT_PATH = _default_root() / "credentials.enc"
 
+@functools.lru_cache(maxsize=4)
+def _get_fernet(key_path: Path) -> Fernet:
+    # Key is read and parsed once per process; restart to pick up a rotated key
+    return Fernet(load_key(key_path))
+
 class CredentialVault:
-    def __init__(self, vault_path: Path = DEFAULT_VAULT_PATH):
+    def __init__(self, vault_path: Path = DEFAULT_VAULT_PATH, key_path: Path = DEFAULT_KEY_PATH):
         self.vault_path = vault_path
-        self.fernet = Fernet(load_key())
+        self.fernet = _get_fernet(key_path)
 
     def _load(self) -> Dict[str, Any]:
         if not self.vault_path.exists():
             return {}
-        return json.loads(self.fernet.decrypt(self.vault_path.read_bytes()).decode())
+        return orjson.loads(self.fernet.decrypt(self.vault_path.read_bytes()))
 
     def _write(self, data: Dict[str, Any]) -> None:
         self.vault_path.parent.mkdir(parents=True, exist_ok=True)
-        self.vault_path.write_bytes(self.fernet.encrypt(json.dumps(data, indent=2).encode()))
+        self.vault_path.write_bytes(self.fernet.encrypt(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)))
 
     def save_credentials(self, path: str, secrets: Dict[str, str], metadata: Optional[Dict[str, Any]] = None):
         data = self._load()
         data[path] = {
             "secrets": secrets,
-            "metadata": {"created_at": datetime.utcnow().isoformat(), **(metadata or {})},
+            "metadata": {"created_at": datetime.now(timezone.utc).isoformat(timespec='seconds'), **(metadata or {})},
         }
         self._write(data)
 
+    def bulk_save(self, records: Dict[str, Dict[str, str]], metadata: Optional[Dict[str, Any]] = None):
+        """Save many {path: secrets} entries with one decrypt and one encrypt of the vault."""
+        data = self._load()
+        created_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        for path, secrets in records.items():
+            data[path] = {
+                "secrets": secrets,
+                "metadata": {"created_at": created_at, **(metadata or {})},
+            }
+        self._write(data)
+
     def load_credentials(self, path: str) -> Dict[str, str]:
         data = self._load()
         if path not in data:
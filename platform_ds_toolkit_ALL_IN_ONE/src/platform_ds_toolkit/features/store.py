@@ -1,12 +1,38 @@
 
 from pathlib import Path
-import json, pandas as pd
-from datetime import datetime
+import orjson, pyarrow as pa, pyarrow.parquet as pq
+from datetime import datetime, timezone
 
 class FeatureStore:
     def __init__(self, root: Path): self.root=root; root.mkdir(exist_ok=True, parents=True)
     def save(self, name, df, version):
         p=self.root/name/version; p.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(p/'data.parquet')
-        (p/'manifest.json').write_text(json.dumps({'name':name,'version':version,'created_at':datetime.utcnow().isoformat()},indent=2))
-    def load(self, name, version): return pd.read_parquet(self.root/name/version/'data.parquet')
+        df.to_parquet(p/'data.parquet', engine='pyarrow', compression='zstd', compression_level=3, row_group_size=128_000, use_dictionary=True)
+        self._manifest(p, name, version)
+    def save_iter(self, name, df_iter, version):
+        # streams chunks into one parquet file; peak memory is one chunk, schema comes from the first
+        p=self.root/name/version; p.mkdir(parents=True, exist_ok=True); w=None
+        try:
+            for chunk in df_iter:
+                t=pa.Table.from_pandas(chunk, schema=w.schema if w else None, preserve_index=False)
+                if w is None: w=pq.ParquetWriter(p/'data.parquet', t.schema, compression='zstd', compression_level=3, use_dictionary=True)
+                w.write_table(t, row_group_size=128_000)
+        finally:
+            if w is not None: w.close()
+        if w is None: raise ValueError(f"No chunks to save for feature set '{name}/{version}'")
+        self._manifest(p, name, version)
+    def load(self, name, version, columns=None):
+        # memory-mapped read, only the requested columns (plus any saved index); numeric columns convert to pandas without a copy
+        t=pq.read_table(self.root/name/version/'data.parquet', columns=columns, memory_map=True, use_pandas_metadata=True)
+        return t.to_pandas(self_destruct=True, split_blocks=True)
+    def load_iter(self, name, version, batch_size=128_000, columns=None):
+        f=pq.ParquetFile(self.root/name/version/'data.parquet', memory_map=True)
+        # a RangeIndex is stored only as a whole-table descriptor, so each batch would restart at 0; continue it instead
+        idx=(f.schema_arrow.pandas_metadata or {}).get('index_columns', [])
+        rng=idx[0] if len(idx)==1 and isinstance(idx[0], dict) and idx[0].get('kind')=='range' else None; n=0
+        for b in f.iter_batches(batch_size=batch_size, columns=columns, use_pandas_metadata=True):
+            df=b.to_pandas()
+            if rng: df.index=range(rng['start']+n*rng['step'], rng['start']+(n+len(df))*rng['step'], rng['step']); df.index.name=rng['name']; n+=len(df)
+            yield df
+    def _manifest(self, p, name, version):
+        (p/'manifest.json').write_bytes(orjson.dumps({'name':name,'version':version,'created_at':datetime.now(timezone.utc).isoformat(timespec='seconds')},option=orjson.OPT_INDENT_2))
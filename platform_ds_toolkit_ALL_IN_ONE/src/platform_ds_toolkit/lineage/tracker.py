@@ -1,5 +1,37 @@
-import json, datetime
+import orjson, datetime, queue, threading, weakref, logging, time, functools
 from pathlib import Path
+logger=logging.getLogger(__name__)
+@functools.lru_cache(maxsize=1)
+def _iso(sec): return datetime.datetime.fromtimestamp(sec, datetime.timezone.utc).isoformat(timespec='seconds')  # one format per second, not per event
+def _drain(q,r):
+  # module-level (no reference to the tracker) so an unreferenced tracker can be collected
+  while True:
+    batch=[q.get()]
+    while True:
+      try: batch.append(q.get_nowait())
+      except queue.Empty: break
+    try:
+      days={}
+      for e in batch:
+        if e is not None: days.setdefault(e[0],[]).append(e[1])
+      for d,lines in days.items():
+        with open(r/f'lineage-{d}.jsonl','ab') as f: f.writelines(lines)
+    except Exception: logger.exception('failed to write %d lineage events', len(batch))
+    finally:
+      for _ in batch: q.task_done()
+    if None in batch: return
+def _stop(q,t):
+  if t.is_alive(): q.put(None); t.join()
 class LineageTracker:
-  def __init__(s,r): s.r=r; r.mkdir(exist_ok=True, parents=True)
-  def record(s,o,i): (s.r/f'{o}.json').write_text(json.dumps({'output':o,'inputs':i,'ts':datetime.datetime.utcnow().isoformat()},indent=2))
+  # record() serializes and enqueues; a daemon thread appends the lines in batches to r/lineage-YYYYMMDD.jsonl (no fsync).
+  # flush() blocks until queued events are on disk; close() (also run at exit or when collected) stops the writer.
+  def __init__(s,r):
+    s.r=r; r.mkdir(exist_ok=True, parents=True); s._q=queue.Queue(); s._closed=False
+    t=threading.Thread(target=_drain, args=(s._q,r), name='lineage-writer', daemon=True); t.start()
+    s._finalizer=weakref.finalize(s,_stop,s._q,t)
+  def record(s,o,i):
+    if s._closed: raise RuntimeError('LineageTracker is closed')
+    # serialize now: bad inputs raise here, and later mutation of i can't change the event
+    ts=_iso(int(time.time())); s._q.put_nowait((ts[:10].replace('-',''), orjson.dumps({'output':o,'inputs':i,'ts':ts})+b'\n'))
+  def flush(s): s._q.join()
+  def close(s): s._closed=True; s._finalizer()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 import json
+import os
+import pickle
 import joblib
 
 
@@ -14,16 +16,22 @@ class ModelStore:
     Layout:
         model_store/
             model_name/
+                HEAD.json        # {"latest": <newest label>, "vmax": <highest N among vN labels>}
                 v1/
                     model.joblib
                     manifest.json
                 v2/
                     ...
+
+    Artifacts are zlib-compressed (``compress=3``) by default. Pass ``compress=0`` to
+    store them uncompressed so ``load(..., mmap_mode="r")`` can memory-map their
+    numpy arrays; joblib cannot memory-map compressed files.
     """
 
-    def __init__(self, root: Path, read_only: bool = False):
+    def __init__(self, root: Path, read_only: bool = False, compress: Any = 3):
         self.root = root
         self.read_only = read_only
+        self.compress = compress
         self.root.mkdir(parents=True, exist_ok=True)
 
     # ---------- public API ----------
@@ -57,14 +65,19 @@ class ModelStore:
         path.mkdir(parents=True, exist_ok=True)
 
         # Save model
-        joblib.dump(model, path / "model.joblib")
+        joblib.dump(
+            model,
+            path / "model.joblib",
+            compress=self.compress,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
 
         # Save manifest
         manifest = {
             "artifact_type": "model",
             "name": name,
             "version": version,
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
             "metadata": metadata or {},
         }
 
@@ -72,14 +85,26 @@ class ModelStore:
             json.dumps(manifest, indent=2)
         )
 
+        head = self._head(name)
+        if head is not None:
+            updated = {
+                "latest": max(head["latest"], version, key=self._sort_key),
+                "vmax": max(head["vmax"], self._version_num(version) or 0),
+            }
+            if updated != head:
+                self._write_head(name, updated)
+
         return path
 
-    def load(self, name: str, version: str = "latest") -> Any:
+    def load(self, name: str, version: str = "latest", mmap_mode: Optional[str] = None) -> Any:
         """
         Load a model artifact.
+
+        mmap_mode (e.g. "r") memory-maps numpy arrays of uncompressed artifacts
+        instead of reading them into memory; it is ignored for compressed ones.
         """
         path = self._resolve_version(name, version)
-        return joblib.load(path / "model.joblib")
+        return joblib.load(path / "model.joblib", mmap_mode=mmap_mode)
 
     def info(self, name: str, version: str = "latest") -> Dict[str, Any]:
         """
@@ -105,14 +130,62 @@ class ModelStore:
 
     # ---------- helpers ----------
 
+    @staticmethod
+    def _version_num(version: str) -> Optional[int]:
+        if version.startswith("v") and version[1:].isdigit():
+            return int(version[1:])
+        return None
+
+    @classmethod
+    def _sort_key(cls, version: str) -> tuple:
+        # Plain string order (as list_versions sorts), except vN labels compare numerically
+        num = cls._version_num(version)
+        return ("v", num) if num is not None else (version, -1)
+
+    def _read_head(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            head = json.loads((self.root / name / "HEAD.json").read_text())
+            return {"latest": str(head["latest"]), "vmax": int(head["vmax"])}
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_head(self, name: str, head: Dict[str, Any]) -> None:
+        path = self.root / name / "HEAD.json"
+        tmp = path.with_name(f"HEAD.json.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(head))
+        os.replace(tmp, path)
+
+    def _scan_head(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Bootstrap/repair path: derive HEAD from the directory listing.
+        """
+        versions = self.list_versions(name)
+        if not versions:
+            return None
+        nums = [n for n in map(self._version_num, versions) if n is not None]
+        return {"latest": max(versions, key=self._sort_key), "vmax": max(nums, default=0)}
+
+    def _head(self, name: str) -> Optional[Dict[str, Any]]:
+        head = self._read_head(name)
+        if head is not None and (self.root / name / head["latest"]).exists():
+            return head
+
+        head = self._scan_head(name)
+        if head is not None and not self.read_only:
+            self._write_head(name, head)
+        return head
+
+    def _latest(self, name: str) -> Optional[str]:
+        head = self._head(name)
+        return head["latest"] if head is not None else None
+
     def _next_version(self, name: str) -> str:
         base = self.root / name
         if not base.exists():
             return "v1"
 
-        versions = self.list_versions(name)
-        nums = [int(v[1:]) for v in versions if v.startswith("v")]
-        return f"v{max(nums) + 1}"
+        head = self._head(name)
+        return f"v{(head['vmax'] if head is not None else 0) + 1}"
 
     def _resolve_version(self, name: str, version: str) -> Path:
         base = self.root / name
@@ -120,10 +193,10 @@ class ModelStore:
             raise ValueError(f"No model named '{name}' found")
 
         if version == "latest":
-            versions = self.list_versions(name)
-            if not versions:
+            latest = self._latest(name)
+            if latest is None:
                 raise ValueError(f"No versions found for model '{name}'")
-            version = versions[-1]
+            version = latest
 
         path = base / version
         if not path.exists():
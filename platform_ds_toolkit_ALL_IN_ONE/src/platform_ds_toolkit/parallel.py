@@ -1,4 +1,10 @@
-import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-def parallel_map(f, xs):
-  with mp.Pool() as p: return p.map(f,xs)
+def parallel_map(f, xs, threads=False, max_workers=None):
+  # threads=True: no process spawn or pickling, for f that releases the GIL (NumPy/BLAS, IO)
+  xs=list(xs); n=max_workers or os.cpu_count() or 1
+  if threads:
+    with ThreadPoolExecutor(n) as ex: return list(ex.map(f,xs))
+  # ~4 chunks per worker: amortizes pickling without one slow chunk setting the tail latency
+  with ProcessPoolExecutor(n) as ex: return list(ex.map(f,xs,chunksize=max(1,len(xs)//(4*n))))
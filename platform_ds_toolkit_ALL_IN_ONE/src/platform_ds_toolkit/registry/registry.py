@@ -1,6 +1,41 @@
-import json
+import os, json, orjson
 from pathlib import Path
+
+def _stamp(p):
+  try: st=p.stat(); return (st.st_mtime_ns, st.st_size, st.st_ino)
+  except FileNotFoundError: return None
+
+def _key(n):
+  # dict keys become JSON strings anyway (json.dumps did this on the old per-write path); do it up front
+  # so resolve(1) finds the entry both before and after compaction
+  if isinstance(n,str): return n
+  if n is None or isinstance(n,(bool,int,float)): return json.dumps(n)
+  raise TypeError(f'registry names must be str, int, float, bool or None, not {type(n).__name__}')
+
 class Registry:
-  def __init__(s,p): s.p=p; p.write_text('{}') if not p.exists() else None
-  def register(s,n,l): d=json.loads(s.p.read_text()); d[n]=l; s.p.write_text(json.dumps(d,indent=2))
-  def resolve(s,n): return json.loads(s.p.read_text())[n]
+  # p holds the compacted JSON snapshot; register() appends to <stem>.log.jsonl beside it.
+  # resolve() sees snapshot + log, parsing only log bytes it hasn't seen yet; once the log
+  # passes compact_bytes, register() folds it back into the snapshot.
+  def __init__(s,p,compact_bytes=1<<20):
+    s.p=p; s.log=p.with_name(p.stem+'.log.jsonl'); s.compact_bytes=compact_bytes; s._d=None; s._snap=None; s._ino=None; s._off=0
+    p.write_text('{}') if not p.exists() else None
+  def register(s,n,l):
+    with open(s.log,'ab') as f: f.write(orjson.dumps({'n':_key(n),'l':l})+b'\n'); size=f.tell()
+    if size>=s.compact_bytes: s.compact()
+  def resolve(s,n): return s._load()[_key(n)]
+  def compact(s):
+    # not safe while another process is registering: its appends between replace and unlink are lost
+    d=s._load(); tmp=s.p.with_name(s.p.name+'.tmp'); tmp.write_bytes(orjson.dumps(d,option=orjson.OPT_INDENT_2)); os.replace(tmp,s.p)
+    s.log.unlink(missing_ok=True); s._d=None
+  def _load(s):
+    snap,log=_stamp(s.p),_stamp(s.log)
+    if s._d is None or snap!=s._snap or (log and (log[2]!=s._ino or log[1]<s._off)) or (not log and s._off):
+      # first load, or the snapshot / log was replaced or truncated: rebuild from scratch
+      s._d=orjson.loads(s.p.read_bytes()); s._snap=snap; s._ino=log and log[2]; s._off=0
+    if log and log[1]>s._off:
+      with open(s.log,'rb') as f: f.seek(s._off); tail=f.read()
+      tail=tail[:tail.rfind(b'\n')+1]  # a line still being appended is picked up next time
+      for line in tail.splitlines():
+        if line: e=orjson.loads(line); s._d[e['n']]=e['l']
+      s._off+=len(tail)
+    return s._d